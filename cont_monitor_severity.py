@@ -6,8 +6,12 @@ import numpy as np
 from datetime import datetime, timedelta
 import time
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from geopy.geocoders import Nominatim
 from geopy.distance import geodesic
+from fire_news_parsing import FireIncidentAnalyzer, parse_news_results
 import feedparser
 import nltk
 from nltk.tokenize import word_tokenize
@@ -20,46 +24,6 @@ except LookupError:
     nltk.download('punkt')
     nltk.download('stopwords')
 
-class FireIncidentAnalyzer:
-    def __init__(self):
-        """Initialize the fire incident severity analyzer"""
-        self.severity_keywords = {
-            'critical': ['major', 'massive', 'explosive', 'evacuation', 'multiple alarm', 'deaths',
-                        'fatalities', 'catastrophic', 'out of control'],
-            'high': ['large', 'spreading', 'structural', 'injuries', 'homes threatened',
-                    'buildings damaged', 'widespread'],
-            'medium': ['contained', 'under control', 'brush fire', 'vehicle fire',
-                      'limited damage', 'minor injuries'],
-            'low': ['small', 'controlled', 'extinguished', 'minor', 'no injuries',
-                   'quickly contained']
-        }
-
-    def classify_severity(self, text):
-        """
-        Classify the severity of a fire incident based on article text
-
-        Returns:
-        tuple: (severity_level, confidence_score)
-        """
-        text_lower = text.lower()
-        scores = {level: 0 for level in self.severity_keywords.keys()}
-
-        # Count keyword matches for each severity level
-        for level, keywords in self.severity_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    scores[level] += 1
-
-        # Calculate severity level and confidence
-        max_score = max(scores.values())
-        if max_score == 0:
-            return ('unknown', 0.0)
-
-        severity = max(scores.items(), key=lambda x: x[1])[0]
-        confidence = max_score / len(self.severity_keywords[severity])
-
-        return (severity, round(confidence, 2))
-
 class LocationManager:
     def __init__(self):
         """Initialize the location manager with geocoding capability"""
@@ -125,16 +89,26 @@ class FireDepartmentFeed:
             return pd.DataFrame()
 
 class EnhancedFireNewsMonitor:
-    def __init__(self, city, radius_miles=50):
+    def __init__(self, city, radius_miles=50, use_process_pool=False, max_workers=None):
         """
         Initialize enhanced fire news monitor
 
         Parameters:
         city (str): Primary city to monitor
         radius_miles (int): Radius in miles to monitor around the city
+        use_process_pool (bool): Parse and score pages in worker processes.
+            Workers import parse_news_results from fire_news_parsing.py,
+            so that file must sit next to this one (or on sys.path).
+        max_workers (int): Worker process count (None for one per core)
+
+        With the process pool enabled, call close() or use the monitor as a
+        context manager so worker processes are shut down.
         """
         self.city = city
         self.radius_miles = radius_miles
+        self.use_process_pool = use_process_pool
+        self.max_workers = max_workers
+        self._executor = None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
@@ -143,6 +117,71 @@ class EnhancedFireNewsMonitor:
         self.incident_analyzer = FireIncidentAnalyzer()
         self.department_feed = FireDepartmentFeed()
 
+    def _get_executor(self):
+        """Return the shared process pool, creating it on first use"""
+        if not self.use_process_pool:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self):
+        """Shut down the process pool if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _collect_new_articles(self, articles, all_articles):
+        """Add parsed articles that haven't been seen and are within radius"""
+        for article in articles:
+            article_id = f"{article['Title']}:{article['Source']}"
+
+            if article_id not in self.known_articles:
+                # Calculate distance from primary city
+                distance = self.location_manager.calculate_distance(self.city, article['Location'])
+
+                if distance is None or distance <= self.radius_miles:
+                    self.known_articles.add(article_id)
+                    all_articles.append({
+                        'Title': article['Title'],
+                        'Source': article['Source'],
+                        'Date': article['Date'],
+                        'Link': article['Link'],
+                        'Location': article['Location'],
+                        'Distance': distance,
+                        'Severity': article['Severity'],
+                        'Confidence': article['Confidence']
+                    })
+
+    def _merge_parsed(self, pending, all_articles, wait=False):
+        """
+        Merge parse jobs from the front of the queue, in search order
+
+        Stops at the first job still running unless wait is set. A job
+        that failed in the worker is parsed inline so its page isn't lost.
+        """
+        while pending and (wait or pending[0][0].done()):
+            future, executor, args = pending.popleft()
+            location = args[1]
+            try:
+                articles = future.result()
+            except BrokenProcessPool as e:
+                print(f"Process pool failed, parsing news for {location} inline: {e}")
+                if executor is self._executor:
+                    self.close()
+                articles = parse_news_results(*args)
+            except Exception as e:
+                print(f"Error parsing news for {location} in worker, parsing inline: {e}")
+                articles = parse_news_results(*args)
+
+            self._collect_new_articles(articles, all_articles)
+
     def get_nearby_cities(self):
         """Get list of major cities within specified radius"""
         # This would ideally use a geographic database
@@ -158,6 +197,11 @@ class EnhancedFireNewsMonitor:
         """
         Search for fire-related news with enhanced filtering and analysis
 
+        In pipeline mode each fetched page is handed to the process pool
+        while the next location is fetched. Finished pages are merged
+        between fetches, in search order, so de-duplication matches
+        inline mode.
+
         Parameters:
         include_nearby (bool): Include news from nearby cities within radius
 
@@ -175,6 +219,8 @@ class EnhancedFireNewsMonitor:
         if not dept_updates.empty:
             all_articles.extend(dept_updates.to_dict('records'))
 
+        pending = deque()
+
         # Search news for each location
         for location in search_locations:
             query = f"fire {location}".replace(' ', '+')
@@ -182,45 +228,27 @@ class EnhancedFireNewsMonitor:
 
             try:
                 response = requests.get(url, headers=self.headers)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                articles = soup.find_all('article', class_='MQsxIb')
-
-                for article in articles:
-                    try:
-                        title = article.find('h3').text.strip()
-                        source = article.find('div', class_='UPmit').text.strip()
-                        date = article.find('time')['datetime']
-                        link = 'https://news.google.com' + article.find('a')['href'][1:]
-
-                        article_id = f"{title}:{source}"
-
-                        if article_id not in self.known_articles:
-                            # Calculate distance from primary city
-                            distance = self.location_manager.calculate_distance(self.city, location)
-
-                            if distance is None or distance <= self.radius_miles:
-                                # Analyze severity
-                                severity, confidence = self.incident_analyzer.classify_severity(title)
-
-                                self.known_articles.add(article_id)
-                                all_articles.append({
-                                    'Title': title,
-                                    'Source': source,
-                                    'Date': pd.to_datetime(date),
-                                    'Link': link,
-                                    'Location': location,
-                                    'Distance': distance,
-                                    'Severity': severity,
-                                    'Confidence': confidence
-                                })
-
-                    except Exception as e:
-                        continue
-
             except Exception as e:
                 print(f"Error fetching news for {location}: {e}")
                 continue
 
+            args = (response.text, location, self.incident_analyzer)
+
+            executor = self._get_executor()
+            if executor:
+                try:
+                    pending.append((executor.submit(parse_news_results, *args), executor, args))
+                except BrokenProcessPool as e:
+                    print(f"Process pool failed, parsing news for {location} inline: {e}")
+                    self.close()
+                    self._merge_parsed(pending, all_articles, wait=True)
+                    self._collect_new_articles(parse_news_results(*args), all_articles)
+                self._merge_parsed(pending, all_articles)
+            else:
+                self._collect_new_articles(parse_news_results(*args), all_articles)
+
+        self._merge_parsed(pending, all_articles, wait=True)
+
         # Create and process DataFrame
         news_df = pd.DataFrame(all_articles)
         if not news_df.empty:
@@ -285,6 +313,8 @@ class EnhancedFireNewsMonitor:
 
         except KeyboardInterrupt:
             print("\nMonitoring stopped by user")
+        finally:
+            self.close()
 
         print("Monitoring session ended")
 
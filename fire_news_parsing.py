@@ -0,0 +1,80 @@
+from bs4 import BeautifulSoup
+import pandas as pd
+
+class FireIncidentAnalyzer:
+    def __init__(self):
+        """Initialize the fire incident severity analyzer"""
+        self.severity_keywords = {
+            'critical': ['major', 'massive', 'explosive', 'evacuation', 'multiple alarm', 'deaths',
+                        'fatalities', 'catastrophic', 'out of control'],
+            'high': ['large', 'spreading', 'structural', 'injuries', 'homes threatened',
+                    'buildings damaged', 'widespread'],
+            'medium': ['contained', 'under control', 'brush fire', 'vehicle fire',
+                      'limited damage', 'minor injuries'],
+            'low': ['small', 'controlled', 'extinguished', 'minor', 'no injuries',
+                   'quickly contained']
+        }
+
+    def classify_severity(self, text):
+        """
+        Classify the severity of a fire incident based on article text
+
+        Returns:
+        tuple: (severity_level, confidence_score)
+        """
+        text_lower = text.lower()
+        scores = {level: 0 for level in self.severity_keywords.keys()}
+
+        # Count keyword matches for each severity level
+        for level, keywords in self.severity_keywords.items():
+            for keyword in keywords:
+                if keyword in text_lower:
+                    scores[level] += 1
+
+        # Calculate severity level and confidence
+        max_score = max(scores.values())
+        if max_score == 0:
+            return ('unknown', 0.0)
+
+        severity = max(scores.items(), key=lambda x: x[1])[0]
+        confidence = max_score / len(self.severity_keywords[severity])
+
+        return (severity, round(confidence, 2))
+
+def parse_news_results(html, location, analyzer):
+    """
+    Parse a Google News results page and score each article
+
+    Lives in its own module so worker processes can import it whatever
+    the start method. Distance is left to the caller, which holds the
+    geocoding cache.
+
+    Returns:
+    list: Article dicts without the Distance field
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    articles = []
+
+    for article in soup.find_all('article', class_='MQsxIb'):
+        try:
+            title = article.find('h3').text.strip()
+            source = article.find('div', class_='UPmit').text.strip()
+            date = article.find('time')['datetime']
+            link = 'https://news.google.com' + article.find('a')['href'][1:]
+
+            severity, confidence = analyzer.classify_severity(title)
+
+            articles.append({
+                'Title': title,
+                'Source': source,
+                'Date': pd.to_datetime(date),
+                'Link': link,
+                'Location': location,
+                'Severity': severity,
+                'Confidence': confidence
+            })
+
+        except Exception as e:
+            continue
+
+    return articles